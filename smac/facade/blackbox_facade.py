@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+
 import numpy as np
 import sklearn.gaussian_process.kernels as kernels
 from ConfigSpace import Configuration
@@ -9,7 +11,11 @@ from smac.acquisition.maximizer.local_and_random_search import (
     LocalAndSortedRandomSearch,
 )
 from smac.facade.abstract_facade import AbstractFacade
-from smac.initial_design.sobol_design import SobolInitialDesign
+from smac.initial_design.latin_hypercube_design import LatinHypercubeInitialDesign
+from smac.initial_design.sobol_design import (
+    MAX_SOBOL_DIMENSIONS,
+    SobolInitialDesign,
+)
 from smac.intensifier.intensifier import Intensifier
 from smac.main.config_selector import ConfigSelector
 from smac.model.gaussian_process.abstract_gaussian_process import (
@@ -29,10 +35,19 @@ from smac.random_design.probability_design import ProbabilityRandomDesign
 from smac.runhistory.encoder.encoder import RunHistoryEncoder
 from smac.scenario import Scenario
 from smac.utils.configspace import get_types
+from smac.utils.logging import get_logger
 
 __copyright__ = "Copyright 2022, automl.org"
 __license__ = "3-clause BSD"
 
+logger = get_logger(__name__)
+
+
+# Bounds of the kernel hyperparameters, evaluated once at import time
+_LS_LO, _LS_HI = math.exp(-6.754111155189306), math.exp(0.0858637988771976)
+_CK_LO, _CK_HI = math.exp(-10.0), math.exp(2.0)
+_NK_LO, _NK_HI = math.exp(-25.0), math.exp(2.0)
+
 
 class BlackBoxFacade(AbstractFacade):
     def _validate(self) -> None:
@@ -53,6 +68,8 @@ class BlackBoxFacade(AbstractFacade):
         *,
         model_type: str | None = None,
         kernel: kernels.Kernel | None = None,
+        mcmc_chain_length: int | None = None,
+        mcmc_burning_steps: int | None = None,
     ) -> AbstractGaussianProcess:
         """Returns a Gaussian Process surrogate model.
 
@@ -63,6 +80,12 @@ class BlackBoxFacade(AbstractFacade):
             Which Gaussian Process model should be chosen. Choose between `vanilla` and `mcmc`.
         kernel : kernels.Kernel | None, defaults to None
             The kernel used in the surrogate model.
+        mcmc_chain_length : int | None, defaults to None
+            The length of the MCMC chain (only used if ``model_type`` is `mcmc`). If None, it is set to
+            ``max(50, 10 * n)``, where ``n`` is the number of kernel hyperparameters.
+        mcmc_burning_steps : int | None, defaults to None
+            The number of burning steps before the MCMC sampling starts (only used if ``model_type`` is `mcmc`). If
+            None, it is set to ``max(50, 10 * n)``, where ``n`` is the number of kernel hyperparameters.
 
         Returns
         -------
@@ -85,16 +108,23 @@ class BlackBoxFacade(AbstractFacade):
                 seed=scenario.seed,
             )
         elif model_type == "mcmc":
-            n_mcmc_walkers = 3 * len(kernel.theta)
-            if n_mcmc_walkers % 2 == 1:
-                n_mcmc_walkers += 1
+            # Three walkers per kernel hyperparameter, rounded up to the next even number
+            n_kernel_hps = len(kernel.theta)
+            n_mcmc_walkers = (3 * n_kernel_hps + 1) & ~1
+
+            # Every step of every walker evaluates the likelihood, hence the chain scales with the kernel
+            if mcmc_chain_length is None:
+                mcmc_chain_length = max(50, 10 * n_kernel_hps)
+
+            if mcmc_burning_steps is None:
+                mcmc_burning_steps = max(50, 10 * n_kernel_hps)
 
             return MCMCGaussianProcess(
                 configspace=scenario.configspace,
                 kernel=kernel,
                 n_mcmc_walkers=n_mcmc_walkers,
-                chain_length=250,
-                burning_steps=250,
+                chain_length=mcmc_chain_length,
+                burning_steps=mcmc_burning_steps,
                 normalize_y=True,
                 seed=scenario.seed,
             )
@@ -109,24 +139,32 @@ class BlackBoxFacade(AbstractFacade):
         categorical (HammingKernel), continuous (Matern), and noise kernels (White).
         """
         types, _ = get_types(scenario.configspace, instance_features=None)
-        cont_dims = np.where(np.array(types) == 0)[0]
-        cat_dims = np.where(np.array(types) != 0)[0]
+        types_array = np.asarray(types)
+        cont_mask = types_array == 0
+        cont_dims = np.flatnonzero(cont_mask)
+        cat_dims = np.flatnonzero(~cont_mask)
 
-        if (len(cont_dims) + len(cat_dims)) != len(scenario.configspace.get_hyperparameters()):
+        n_hps = len(scenario.configspace)
+        if types_array.size != n_hps:
             raise ValueError(
                 "The inferred number of continuous and categorical hyperparameters "
-                "must equal the total number of hyperparameters. Got "
-                f"{(len(cont_dims) + len(cat_dims))} != {len(scenario.configspace.get_hyperparameters())}."
+                f"must equal the total number of hyperparameters. Got {types_array.size} != {n_hps}."
             )
 
+        # The priors are also sampled from (e.g., for the restarts of the hyperparameter optimization). Seeding both
+        # with the scenario seed would make their samples perfectly correlated, hence we derive independent seeds.
+        cov_amp_seed, noise_seed = (
+            int(seed_seq.generate_state(1)[0]) for seed_seq in np.random.SeedSequence(scenario.seed).spawn(2)
+        )
+
         # Constant Kernel
         cov_amp = ConstantKernel(
             2.0,
-            constant_value_bounds=(np.exp(-10), np.exp(2)),
+            constant_value_bounds=(_CK_LO, _CK_HI),
             prior=LogNormalPrior(
                 mean=0.0,
                 sigma=1.0,
-                seed=scenario.seed,
+                seed=cov_amp_seed,
             ),
         )
 
@@ -135,22 +173,22 @@ class BlackBoxFacade(AbstractFacade):
         if len(cont_dims) > 0:
             exp_kernel = MaternKernel(
                 np.ones([len(cont_dims)]),
-                [(np.exp(-6.754111155189306), np.exp(0.0858637988771976)) for _ in range(len(cont_dims))],
+                (_LS_LO, _LS_HI),
                 nu=2.5,
                 operate_on=cont_dims,
             )
         if len(cat_dims) > 0:
             ham_kernel = HammingKernel(
                 np.ones([len(cat_dims)]),
-                [(np.exp(-6.754111155189306), np.exp(0.0858637988771976)) for _ in range(len(cat_dims))],
+                (_LS_LO, _LS_HI),
                 operate_on=cat_dims,
             )
 
         # Noise Kernel
         noise_kernel = WhiteKernel(
             noise_level=1e-8,
-            noise_level_bounds=(np.exp(-25), np.exp(2)),
-            prior=HorseshoePrior(scale=0.1, seed=scenario.seed),
+            noise_level_bounds=(_NK_LO, _NK_HI),
+            prior=HorseshoePrior(scale=0.1, seed=noise_seed),
         )
 
         # Continuous and categecorical HPs
@@ -242,8 +280,9 @@ class BlackBoxFacade(AbstractFacade):
         n_configs_per_hyperparamter: int = 8,
         max_ratio: float = 0.25,
         additional_configs: list[Configuration] = None,
-    ) -> SobolInitialDesign:
-        """Returns a Sobol design instance.
+    ) -> SobolInitialDesign | LatinHypercubeInitialDesign:
+        """Returns a Sobol design instance. Since the Sobol sequence supports at most ``MAX_SOBOL_DIMENSIONS``
+        dimensions, a Latin Hypercube design is returned for larger configuration spaces.
 
         Parameters
         ----------
@@ -262,7 +301,16 @@ class BlackBoxFacade(AbstractFacade):
         """
         if additional_configs is None:
             additional_configs = []
-        return SobolInitialDesign(
+
+        initial_design: type[SobolInitialDesign | LatinHypercubeInitialDesign] = SobolInitialDesign
+        if len(scenario.configspace) > MAX_SOBOL_DIMENSIONS:
+            logger.warning(
+                f"The Sobol sequence can only handle up to {MAX_SOBOL_DIMENSIONS} dimensions. Using the Latin "
+                "Hypercube design as initial design instead."
+            )
+            initial_design = LatinHypercubeInitialDesign
+
+        return initial_design(
             scenario=scenario,
             n_configs=n_configs,
             n_configs_per_hyperparameter=n_configs_per_hyperparamter,
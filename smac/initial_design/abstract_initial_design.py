@@ -77,12 +77,11 @@ class AbstractInitialDesign:
 
         self._additional_configs = additional_configs
 
-        n_params = len(self._configspace.get_hyperparameters())
         if n_configs is not None:
             logger.info("Using `n_configs` and ignoring `n_configs_per_hyperparameter`.")
             self._n_configs = n_configs
         elif n_configs_per_hyperparameter is not None:
-            self._n_configs = n_configs_per_hyperparameter * n_params
+            self._n_configs = n_configs_per_hyperparameter * len(self._configspace)
         else:
             raise ValueError(
                 "Need to provide either argument `n_configs` or "
@@ -175,16 +174,19 @@ class AbstractInitialDesign:
             Continuous transformed configs.
         """
         params = configspace.get_hyperparameters()
+
+        # Constants are not part of the design, so it is scattered into an array with a zero column for each constant
+        constant_mask = np.array([isinstance(param, Constant) for param in params], dtype=bool)
+        if constant_mask.any():
+            design_ = np.zeros((design.shape[0], len(params)))
+            design_[:, ~constant_mask] = design
+            design = design_
+
         for idx, param in enumerate(params):
             if isinstance(param, IntegerHyperparameter):
                 design[:, idx] = param._inverse_transform(param._transform(design[:, idx]))
-            elif isinstance(param, NumericalHyperparameter):
+            elif isinstance(param, (NumericalHyperparameter, Constant)):
                 continue
-            elif isinstance(param, Constant):
-                design_ = np.zeros(np.array(design.shape) + np.array((0, 1)))
-                design_[:, :idx] = design[:, :idx]
-                design_[:, idx + 1 :] = design[:, idx:]
-                design = design_
             elif isinstance(param, CategoricalHyperparameter):
                 v_design = design[:, idx]
                 v_design[v_design == 1] = 1 - 10**-10
@@ -14,6 +14,10 @@ __copyright__ = "Copyright 2022, automl.org"
 __license__ = "3-clause BSD"
 
 
+# Maximum number of dimensions supported by scipy's Sobol sequence
+MAX_SOBOL_DIMENSIONS = 21201
+
+
 class SobolInitialDesign(AbstractInitialDesign):
     """Sobol sequence design with a scrambled Sobol sequence. See
     https://scipy.github.io/devdocs/reference/generated/scipy.stats.qmc.Sobol.html for further information.
@@ -22,9 +26,9 @@ class SobolInitialDesign(AbstractInitialDesign):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
-        if len(self._configspace.get_hyperparameters()) > 21201:
+        if len(self._configspace) > MAX_SOBOL_DIMENSIONS:
             raise ValueError(
-                "The default initial design Sobol sequence can only handle up to 21201 dimensions. "
+                f"The default initial design Sobol sequence can only handle up to {MAX_SOBOL_DIMENSIONS} dimensions. "
                 "Please use a different initial design, such as the Latin Hypercube design."
             )
 
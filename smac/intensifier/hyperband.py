@@ -2,9 +2,32 @@ from __future__ import annotations
 
 from typing import Any
 
+from functools import lru_cache
+
 from smac.intensifier.successive_halving import SuccessiveHalving
 
 
+@lru_cache(maxsize=None)
+def _compute_brackets(
+    min_budget: float | int, max_budget: float | int, eta: int
+) -> tuple[tuple[int, tuple[float, ...], tuple[int, ...]], ...]:
+    """Computes the Hyperband brackets, which only depend on the budgets and eta. Returns a tuple of
+    (max iterations, budgets in stage, number of configurations in stage) for each bracket. The result is cached
+    so that creating multiple intensifiers with the same budgets does not repeat the computation.
+    """
+    s_max = SuccessiveHalving._get_max_iterations(eta, max_budget, min_budget)
+
+    brackets = []
+    for i in range(s_max + 1):
+        max_iter = s_max - i
+        budgets, n_configs = SuccessiveHalving._compute_configs_and_budgets_for_stages(
+            eta, max_budget, max_iter, s_max
+        )
+        brackets.append((max_iter + 1, tuple(budgets), tuple(n_configs)))
+
+    return tuple(brackets)
+
+
 class Hyperband(SuccessiveHalving):
     """See ``SuccessiveHalving`` for documentation."""
 
@@ -24,18 +47,16 @@ class Hyperband(SuccessiveHalving):
         eta = self._eta
 
         # The only difference we have to do is change max_iterations, n_configs_in_stage, budgets_in_stage
-        self._s_max = self._get_max_iterations(eta, max_budget, min_budget)  # type: ignore[operator]
+        brackets = _compute_brackets(min_budget, max_budget, eta)
+        self._s_max = len(brackets) - 1
         self._max_iterations: dict[int, int] = {}
         self._n_configs_in_stage: dict[int, list] = {}
         self._budgets_in_stage: dict[int, list] = {}
 
-        for i in range(self._s_max + 1):
-            max_iter = self._s_max - i
-
-            self._budgets_in_stage[i], self._n_configs_in_stage[i] = self._compute_configs_and_budgets_for_stages(
-                eta, max_budget, max_iter, self._s_max
-            )
-            self._max_iterations[i] = max_iter + 1
+        for i, (max_iterations, budgets, n_configs) in enumerate(brackets):
+            self._max_iterations[i] = max_iterations
+            self._budgets_in_stage[i] = list(budgets)
+            self._n_configs_in_stage[i] = list(n_configs)
 
     def get_state(self) -> dict[str, Any]:  # noqa: D102
         state = super().get_state()
@@ -7,6 +7,7 @@ import logging
 import numpy as np
 from ConfigSpace import ConfigurationSpace
 from scipy import optimize
+from scipy.linalg import solve_triangular
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import Kernel
 
@@ -244,20 +245,16 @@ class GaussianProcess(AbstractGaussianProcess):
         X_test = self._impute_inactive(X)
 
         if covariance_type is None:
-            mu = self._gp.predict(X_test)
+            mu, _ = self._predict_posterior(X_test, return_var=False)
             var = None
 
             if self._normalize_y:
                 mu = self._untransform_y(mu)
         else:
-            predict_kwargs = {"return_cov": False, "return_std": True}
             if covariance_type == "full":
-                predict_kwargs = {"return_cov": True, "return_std": False}
-
-            mu, var = self._gp.predict(X_test, **predict_kwargs)
-
-            if covariance_type != "full":
-                var = var**2  # Since we get standard deviation for faster computation
+                mu, var = self._gp.predict(X_test, return_cov=True, return_std=False)
+            else:
+                mu, var = self._predict_posterior(X_test, return_var=True)
 
             # Clip negative variances and set them to the smallest
             # positive float value
@@ -271,6 +268,23 @@ class GaussianProcess(AbstractGaussianProcess):
 
         return mu, var
 
+    def _predict_posterior(self, X_test: np.ndarray, return_var: bool = True) -> tuple[np.ndarray, np.ndarray | None]:
+        """Computes the posterior mean and (diagonal) variance directly from the Cholesky factor and the dual
+        coefficients, which the fitted Gaussian process keeps until the next call to ``train``. This is equivalent to
+        ``GaussianProcessRegressor.predict`` but skips its input validation, which dominates the cost when the
+        acquisition maximizer repeatedly predicts small batches of configurations.
+        """
+        K_trans = self._gp.kernel_(X_test, self._gp.X_train_)
+        mu = K_trans @ self._gp.alpha_
+
+        if not return_var:
+            return mu, None
+
+        V = solve_triangular(self._gp.L_, K_trans.T, lower=True, check_finite=False)
+        var = self._gp.kernel_.diag(X_test) - np.einsum("ij,ij->j", V, V)
+
+        return mu, var
+
     def sample_functions(self, X_test: np.ndarray, n_funcs: int = 1) -> np.ndarray:
         """Samples F function values from the current posterior at the N specified test points.
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 import numpy as np
+import scipy.spatial.distance
 import sklearn.gaussian_process.kernels as kernels
 
 from smac.model.gaussian_process.kernels.base_kernels import AbstractKernel
@@ -95,8 +96,15 @@ class HammingKernel(
         else:
             Y = np.atleast_2d(Y)
 
-        indicator = np.expand_dims(X, axis=1) != Y
-        K = (-1 / (2 * length_scale**2) * indicator).sum(axis=2)
+        if eval_gradient:
+            indicator = np.expand_dims(X, axis=1) != Y
+            K = (-1 / (2 * length_scale**2) * indicator).sum(axis=2)
+        else:
+            # The weighted hamming distance is the weighted mean of the mismatches, hence we rescale by the sum of
+            # the weights. Computing it with scipy avoids materializing the [n_X, n_Y, n_dims] indicator tensor.
+            weights = np.broadcast_to(1 / (2 * length_scale**2), (X.shape[1],))
+            K = -scipy.spatial.distance.cdist(X, Y, metric="hamming", w=weights) * weights.sum()
+
         K = np.exp(K)
 
         if active is not None:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
 from smac.random_design.abstract_random_design import AbstractRandomDesign
 from smac.utils.logging import get_logger
 
@@ -27,6 +29,11 @@ class ProbabilityRandomDesign(AbstractRandomDesign):
         assert 0 <= probability <= 1
         self._probability = probability
 
+        # Uniform samples are drawn in batches since a single draw is dominated by the call overhead. The random
+        # state is only used here, so the sequence of decisions is the same as drawing one sample per check.
+        self._pool = np.empty(0)
+        self._pool_idx = 0
+
     @property
     def meta(self) -> dict[str, Any]:  # noqa: D102
         meta = super().meta
@@ -37,10 +44,14 @@ class ProbabilityRandomDesign(AbstractRandomDesign):
     def check(self, iteration: int) -> bool:  # noqa: D102
         assert iteration >= 0
 
-        if self._rng.rand() < self._probability:
-            return True
-        else:
-            return False
+        if self._pool_idx >= len(self._pool):
+            self._pool = self._rng.rand(4096)
+            self._pool_idx = 0
+
+        sample = self._pool[self._pool_idx]
+        self._pool_idx += 1
+
+        return bool(sample < self._probability)
 
 
 class DynamicProbabilityRandomDesign(AbstractRandomDesign):
@@ -1,4 +1,13 @@
+import numpy as np
 import pytest
+from ConfigSpace import (
+    Categorical,
+    ConfigurationSpace,
+    Constant,
+    Float,
+    Integer,
+    OrdinalHyperparameter,
+)
 
 from smac.initial_design import AbstractInitialDesign
 from smac.initial_design.default_design import DefaultInitialDesign
@@ -134,3 +143,38 @@ def test_include_default_config(make_scenario, configspace_small):
     # if use_default_config is True, then the default config should be included in the additional_configs
     default_config = scenario.configspace.get_default_configuration()
     assert default_config in dc._additional_configs
+
+
+def test_transform_continuous_designs_with_constants(make_scenario):
+    hyperparameters = [
+        Float("b", (0, 1)),
+        Integer("d", (1, 10)),
+        Categorical("e", ["p", "q", "r"]),
+        OrdinalHyperparameter("g", ["low", "mid", "high"]),
+    ]
+    constants = [Constant("a_const", "x"), Constant("c_const", 3), Constant("h_const", "z")]
+
+    cs = ConfigurationSpace(seed=0)
+    cs.add(hyperparameters)
+    cs_constants = ConfigurationSpace(seed=0)
+    cs_constants.add(hyperparameters + constants)
+
+    # The constants have to be the leading, a middle and the trailing hyperparameter
+    assert list(cs_constants.keys()) == ["a_const", "b", "c_const", "d", "e", "g", "h_const"]
+
+    dc = AbstractInitialDesign(scenario=make_scenario(cs_constants), n_configs=10)
+
+    # Constants are not part of the design
+    design = np.random.RandomState(0).rand(10, len(hyperparameters))
+    configs = dc._transform_continuous_designs(design=design.copy(), origin="test", configspace=cs)
+    configs_constants = dc._transform_continuous_designs(
+        design=design.copy(), origin="test", configspace=cs_constants
+    )
+
+    assert len(configs_constants) == len(configs)
+    for config, config_constants in zip(configs, configs_constants):
+        assert config_constants["a_const"] == "x"
+        assert config_constants["c_const"] == 3
+        assert config_constants["h_const"] == "z"
+        for hp in hyperparameters:
+            assert config_constants[hp.name] == config[hp.name]
@@ -1,7 +1,14 @@
+import logging
+
 import pytest
 from ConfigSpace import ConfigurationSpace, Float
 
-from smac.initial_design.sobol_design import SobolInitialDesign
+from smac.facade.blackbox_facade import BlackBoxFacade
+from smac.initial_design.latin_hypercube_design import LatinHypercubeInitialDesign
+from smac.initial_design.sobol_design import (
+    MAX_SOBOL_DIMENSIONS,
+    SobolInitialDesign,
+)
 
 __copyright__ = "Copyright 2021, AutoML.org Freiburg-Hannover"
 __license__ = "3-clause BSD"
@@ -23,7 +30,7 @@ def test_sobol_design(make_scenario, configspace_large):
 
 def test_max_hyperparameters(make_scenario):
     cs = ConfigurationSpace()
-    hyperparameters = [Float("x%d" % (i + 1), (0, 1)) for i in range(21202)]
+    hyperparameters = [Float("x%d" % (i + 1), (0, 1)) for i in range(MAX_SOBOL_DIMENSIONS + 1)]
     cs.add(hyperparameters)
 
     scenario = make_scenario(cs)
@@ -34,3 +41,20 @@ def test_max_hyperparameters(make_scenario):
             n_configs=5,
         )
         initial_design.select_configurations()
+
+
+def test_max_hyperparameters_blackbox_fallback(make_scenario, caplog):
+    cs = ConfigurationSpace()
+    hyperparameters = [Float("x%d" % (i + 1), (0, 1)) for i in range(MAX_SOBOL_DIMENSIONS + 1)]
+    cs.add(hyperparameters)
+
+    scenario = make_scenario(cs)
+
+    # The facade falls back to the Latin Hypercube design instead of raising
+    with caplog.at_level(logging.WARNING, logger="smac.facade.blackbox_facade"):
+        initial_design = BlackBoxFacade.get_initial_design(scenario, n_configs=5)
+
+    assert isinstance(initial_design, LatinHypercubeInitialDesign)
+    assert any(
+        record.levelno == logging.WARNING and "Latin Hypercube" in record.getMessage() for record in caplog.records
+    )
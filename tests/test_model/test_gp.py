@@ -177,6 +177,44 @@ def test_predict():
         assert v_hat.shape == (10, 1)
 
 
+def test_predict_matches_sklearn():
+    seed = 1
+    rs = np.random.RandomState(seed)
+    X, Y, cat_dims, cont_dims = get_cat_data(rs)
+
+    model = get_mixed_gp(cat_dims, cont_dims, seed, normalize_y=False)
+    model.train(X[:10], Y[:10])
+
+    m_hat, v_hat = model.predict(X[10:])
+    m_sklearn, std_sklearn = model._gp.predict(X[10:], return_std=True)
+    np.testing.assert_allclose(m_hat.flatten(), m_sklearn)
+    np.testing.assert_allclose(v_hat.flatten(), np.clip(std_sklearn**2, 1e-10, np.inf), rtol=1e-6)
+
+    m_hat, v_hat = model.predict(X[10:], covariance_type=None)
+    np.testing.assert_allclose(m_hat.flatten(), m_sklearn)
+    assert v_hat is None
+
+
+
+def test_hamming_kernel_matches_indicator():
+    from smac.model.gaussian_process.kernels import HammingKernel
+
+    rs = np.random.RandomState(1)
+    X = rs.randint(low=0, high=3, size=(10, 5)).astype(float)
+    Y = rs.randint(low=0, high=3, size=(7, 5)).astype(float)
+    X[0, 2] = np.nan
+
+    for length_scale in (rs.rand(5) + 0.5, 1.5):
+        kernel = HammingKernel(length_scale=length_scale)
+        for Y_ in (X, Y):
+            indicator = np.expand_dims(X, axis=1) != Y_
+            K = np.exp((-1 / (2 * np.asarray(length_scale) ** 2) * indicator).sum(axis=2))
+            np.testing.assert_allclose(kernel(X, Y_), K)
+
+        # The gradient is computed from the indicator directly, both paths have to agree
+        K, _ = kernel(X, eval_gradient=True)
+        np.testing.assert_allclose(kernel(X), K)
+
 def test_train_do_optimize():
     # Check that do_optimize does not mess with the kernel hyperparameters given to the Gaussian process!
     seed = 1
@@ -4,8 +4,14 @@ import numpy as np
 import pytest
 import sklearn.datasets
 import sklearn.model_selection
-from ConfigSpace import ConfigurationSpace, UniformFloatHyperparameter
-
+from ConfigSpace import (
+    CategoricalHyperparameter,
+    ConfigurationSpace,
+    UniformFloatHyperparameter,
+)
+
+from smac import Scenario
+from smac.facade.blackbox_facade import BlackBoxFacade
 from smac.model.gaussian_process.mcmc_gaussian_process import MCMCGaussianProcess
 from smac.model.gaussian_process.priors import HorseshoePrior, LogNormalPrior
 
@@ -64,6 +70,24 @@ def get_gp(n_dimensions, seed, noise=1e-3, normalize_y=True, average_samples=Fal
     return model
 
 
+def test_blackbox_facade_chain_length():
+    configspace = ConfigurationSpace()
+    configspace.add_hyperparameter(UniformFloatHyperparameter("x", 0, 1))
+    configspace.add_hyperparameter(CategoricalHyperparameter("y", ["a", "b"]))
+    scenario = Scenario(configspace)
+
+    # Amplitude, Matern, Hamming and noise: four kernel hyperparameters
+    model = BlackBoxFacade.get_model(scenario, model_type="mcmc")
+    assert isinstance(model, MCMCGaussianProcess)
+    assert model.meta["n_mcmc_walkers"] == 12
+    assert model.meta["chain_length"] == 50
+    assert model.meta["burning_steps"] == 50
+
+    model = BlackBoxFacade.get_model(scenario, model_type="mcmc", mcmc_chain_length=250, mcmc_burning_steps=100)
+    assert model.meta["chain_length"] == 250
+    assert model.meta["burning_steps"] == 100
+
+
 def test_predict_wrong_X_dimensions():
     seed = 1
     rs = np.random.RandomState(seed)
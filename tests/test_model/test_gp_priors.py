@@ -3,8 +3,11 @@ from functools import partial
 import numpy as np
 import pytest
 import scipy.optimize
+from ConfigSpace import ConfigurationSpace, UniformFloatHyperparameter
 
+from smac import Scenario
 from smac.constants import VERY_SMALL_NUMBER
+from smac.facade.blackbox_facade import BlackBoxFacade
 from smac.model.gaussian_process.priors import (
     GammaPrior,
     HorseshoePrior,
@@ -260,3 +263,20 @@ def test_grad():
 
         error = scipy.optimize.check_grad(prob, grad, np.array([theta]), epsilon=1e-5)
         assert np.round(error) == 0
+
+
+def test_blackbox_kernel_prior_seeds():
+    configspace = ConfigurationSpace()
+    configspace.add_hyperparameter(UniformFloatHyperparameter("x", 0, 1))
+
+    def get_prior_seeds(seed):
+        # Kernel is cov_amp * matern + noise
+        kernel = BlackBoxFacade.get_kernel(Scenario(configspace, seed=seed))
+        return kernel.k1.k1.prior.meta["seed"], kernel.k2.prior.meta["seed"]
+
+    cov_amp_seed, noise_seed = get_prior_seeds(seed=1)
+
+    # The priors must not share a random stream but stay reproducible for the same scenario seed
+    assert cov_amp_seed != noise_seed
+    assert get_prior_seeds(seed=1) == (cov_amp_seed, noise_seed)
+    assert get_prior_seeds(seed=2) != (cov_amp_seed, noise_seed)